@@ -0,0 +1,82 @@
+"""Benchmark Parquet/Arrow ingest and result transfer against the CSV/pandas path.
+
+Usage:
+    python benchmarks/bench_arrow_io.py --rows 1000000
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+sys.path.append('src')
+
+from data_quality_assistant.db.arrow_io import load_file_to_sqlite, query_to_arrow
+
+
+def make_frame(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'id': np.arange(rows),
+        'category': rng.choice(['a', 'b', 'c', 'd'], size=rows),
+        'amount': rng.normal(100, 25, size=rows),
+        'quantity': rng.integers(0, 50, size=rows).astype(float),
+    })
+    df.loc[rng.random(rows) < 0.05, 'quantity'] = np.nan
+    return df
+
+
+def timed(label: str, func) -> None:
+    start = time.perf_counter()
+    func()
+    print(f"{label:<40} {time.perf_counter() - start:8.3f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    df = make_frame(args.rows)
+    query = "SELECT * FROM data_table WHERE amount > 100"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, 'data.csv')
+        parquet_path = os.path.join(tmp, 'data.parquet')
+        arrow_path = os.path.join(tmp, 'data.arrow')
+        db_path = os.path.join(tmp, 'bench.db')
+
+        df.to_csv(csv_path, index=False)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(table, parquet_path, row_group_size=65_536)
+        with pa.ipc.new_file(arrow_path, table.schema) as writer:
+            writer.write_table(table, max_chunksize=65_536)
+
+        def ingest_csv() -> None:
+            with sqlite3.connect(db_path) as conn:
+                pd.read_csv(csv_path).to_sql('data_table', conn, if_exists='replace', index=False)
+
+        def ingest_arrow(path: str) -> None:
+            with sqlite3.connect(db_path) as conn:
+                load_file_to_sqlite(path, conn, 'data_table')
+
+        print(f"Rows: {args.rows:,}")
+        timed("ingest csv (pandas)", ingest_csv)
+        timed("ingest parquet (row groups)", lambda: ingest_arrow(parquet_path))
+        timed("ingest arrow ipc (memory-mapped)", lambda: ingest_arrow(arrow_path))
+
+        with sqlite3.connect(db_path) as conn:
+            timed("result pd.read_sql_query", lambda: pd.read_sql_query(query, conn))
+            timed("result str(rows) (LLM tool path)", lambda: str(conn.execute(query).fetchall()))
+            timed("result query_to_arrow", lambda: query_to_arrow(conn, query))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark concurrent query throughput for inline execution vs the process pool.
+
+Simulates several sessions issuing heavy group-by queries at once and reports
+throughput per pool size together with the executor's utilization metrics.
+
+Usage:
+    python benchmarks/bench_executor.py --rows 2000000 --queries 32
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+sys.path.append('src')
+
+from data_quality_assistant.db.arrow_io import query_to_arrow
+from data_quality_assistant.db.executor import QueryExecutor
+
+QUERY = """
+SELECT category, COUNT(*) AS n, AVG(amount) AS avg_amount, SUM(quantity IS NULL) AS missing
+FROM data_table
+GROUP BY category, CAST(amount AS INTEGER) % 97
+"""
+
+
+def build_database(db_path: str, rows: int) -> None:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'category': rng.choice(['a', 'b', 'c', 'd'], size=rows),
+        'amount': rng.normal(100, 25, size=rows),
+        'quantity': rng.integers(0, 50, size=rows).astype(float),
+    })
+    df.loc[rng.random(rows) < 0.05, 'quantity'] = np.nan
+    with sqlite3.connect(db_path) as conn:
+        df.to_sql('data_table', conn, if_exists='replace', index=False)
+
+
+def run_inline(db_path: str, queries: int, sessions: int) -> float:
+    def session_query(_: int) -> None:
+        conn = sqlite3.connect(db_path)
+        try:
+            query_to_arrow(conn, QUERY)
+        finally:
+            conn.close()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as threads:
+        list(threads.map(session_query, range(queries)))
+    return time.perf_counter() - start
+
+
+def run_pool(db_path: str, queries: int, workers: int) -> float:
+    executor = QueryExecutor(db_path, max_workers=workers)
+    try:
+        executor.run("SELECT 1")
+        start = time.perf_counter()
+        futures = [executor.submit(QUERY) for _ in range(queries)]
+        metrics = executor.metrics()
+        print(f"  after submit: {metrics.in_flight} running, {metrics.queue_depth} queued")
+        for future in futures:
+            future.result()
+        elapsed = time.perf_counter() - start
+
+        for pid, worker in executor.metrics().workers.items():
+            print(f"  worker {pid}: {worker.queries} queries, utilization {worker.utilization:.0%}")
+        return elapsed
+    finally:
+        executor.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=2_000_000)
+    parser.add_argument('--queries', type=int, default=32)
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'bench.db')
+        build_database(db_path, args.rows)
+
+        print(f"Rows: {args.rows:,}  queries: {args.queries}  cores: {cores}")
+        inline = run_inline(db_path, args.queries, cores)
+        print(f"inline (threads, {cores} sessions)  {inline:8.3f}s  {args.queries / inline:6.2f} q/s")
+
+        workers = 1
+        while workers <= cores:
+            elapsed = run_pool(db_path, args.queries, workers)
+            print(f"pool {workers:>2} workers  {elapsed:8.3f}s  {args.queries / elapsed:6.2f} q/s  "
+                  f"speedup vs inline {inline / elapsed:4.2f}x")
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
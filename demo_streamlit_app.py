@@ -3,8 +3,7 @@
 import sys
 import os
 import streamlit as st
-import pandas as pd
-import sqlite3
+import pyarrow as pa
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -19,6 +18,10 @@ from data_quality_assistant.assistant import DataQualityAssistant
 from data_quality_assistant.models.state import DataQualityState
 
 
+# Worker processes shared by all sessions for SQL execution; 0 runs queries in the session thread
+QUERY_EXECUTOR_WORKERS = int(os.getenv("QUERY_EXECUTOR_WORKERS", "0"))
+
+
 st.set_page_config(
     page_title="AI Data Quality Assistant",
     layout="centered"
@@ -170,7 +173,7 @@ def initialize_session_state():
 def load_data_assistant(data_path: str) -> DataQualityAssistant:
     """Load the data quality assistant."""
     try:
-        assistant = DataQualityAssistant(data_path)
+        assistant = DataQualityAssistant(data_path, executor_workers=QUERY_EXECUTOR_WORKERS)
         return assistant
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
@@ -178,16 +181,13 @@ def load_data_assistant(data_path: str) -> DataQualityAssistant:
 
 
 
-def execute_query_for_preview(sql_query: str) -> pd.DataFrame:
+def execute_query_for_preview(sql_query: str) -> pa.Table:
     """Execute SQL query for preview."""
     try:
-        conn = sqlite3.connect('data_quality.db')
-        df = pd.read_sql_query(sql_query, conn)
-        conn.close()
-        return df
+        return st.session_state.assistant.query_arrow(sql_query)
     except Exception as e:
         st.error(f"Error executing query: {str(e)}")
-        return pd.DataFrame()
+        return pa.table({})
 
 def main():
     initialize_session_state()
@@ -199,8 +199,8 @@ def main():
         # File upload
         uploaded_file = st.file_uploader(
             "Upload data file", 
-            type=['csv', 'xlsx', 'xls'],
-            help="CSV or Excel file"
+            type=['csv', 'xlsx', 'xls', 'parquet', 'arrow', 'feather'],
+            help="CSV, Excel, Parquet or Arrow IPC file"
         )
         
         # Load demo data if no file uploaded
@@ -210,8 +210,8 @@ def main():
                 if st.button("Use Demo Data", use_container_width=True):
                     with st.spinner("Loading..."):
                         st.session_state.assistant = load_data_assistant(demo_path)
-                        st.session_state.data = pd.read_excel(demo_path)
                         if st.session_state.assistant:
+                            st.session_state.data = st.session_state.assistant.data_info
                             st.success("Demo data loaded!")
                             st.rerun()
         
@@ -225,10 +225,7 @@ def main():
                 with st.spinner("Loading..."):
                     st.session_state.assistant = load_data_assistant(temp_path)
                     if st.session_state.assistant:
-                        if temp_path.endswith(('.xlsx', '.xls')):
-                            st.session_state.data = pd.read_excel(temp_path)
-                        else:
-                            st.session_state.data = pd.read_csv(temp_path)
+                        st.session_state.data = st.session_state.assistant.data_info
                         st.success("Data loaded!")
             
             if os.path.exists(temp_path):
@@ -241,19 +238,19 @@ def main():
             with col1:
                 st.markdown(f"""
                 <div class="metric-container">
-                    <div class="metric-value">{st.session_state.data.shape[0]:,}</div>
+                    <div class="metric-value">{st.session_state.data['shape'][0]:,}</div>
                     <div class="metric-label">Rows</div>
                 </div>
                 """, unsafe_allow_html=True)
             with col2:
                 st.markdown(f"""
                 <div class="metric-container">
-                    <div class="metric-value">{st.session_state.data.shape[1]}</div>
+                    <div class="metric-value">{st.session_state.data['shape'][1]}</div>
                     <div class="metric-label">Columns</div>
                 </div>
                 """, unsafe_allow_html=True)
             
-            missing_count = st.session_state.data.isnull().sum().sum()
+            missing_count = st.session_state.data['missing_values']
             st.markdown(f"""
             <div class="metric-container">
                 <div class="metric-value">{missing_count:,}</div>
@@ -261,9 +258,18 @@ def main():
             </div>
             """, unsafe_allow_html=True)
             
+            executor_metrics = st.session_state.assistant.executor_metrics() if st.session_state.assistant else None
+            if executor_metrics:
+                st.caption(
+                    f"Query workers: {executor_metrics.max_workers} · "
+                    f"running: {executor_metrics.in_flight} · "
+                    f"queued: {executor_metrics.queue_depth} · "
+                    f"completed: {executor_metrics.completed}"
+                )
+            
             st.markdown("---")
             st.subheader("Original Data")
-            st.dataframe(st.session_state.data.head(15), height=300, use_container_width=True)
+            st.dataframe(st.session_state.data['preview'], height=300, use_container_width=True)
     
     # Main chat interface
     st.title("AI Data Quality Assistant")
@@ -294,7 +300,7 @@ def main():
                 with st.expander("Query Results", expanded=False):
                     try:
                         query_df = execute_query_for_preview(query_result.sql_query)
-                        if not query_df.empty:
+                        if query_df.num_rows > 0:
                             st.dataframe(query_df, height=200, use_container_width=True)
                         else:
                             st.info("Query returned no results")
@@ -3,7 +3,8 @@ import os
 import logging
 import pandas as pd
 import sqlite3
-from typing import Tuple
+import pyarrow as pa
+from typing import List, Optional, Tuple
 from dotenv import load_dotenv
 
 from langchain_openai import ChatOpenAI
@@ -12,6 +13,9 @@ from langchain_community.utilities import SQLDatabase
 from data_quality_assistant.models.state import DataQualityState
 from data_quality_assistant.llm.nodes import DataQualityNodes
 from data_quality_assistant.llm.workflow import DataQualityWorkflow
+from data_quality_assistant.db.arrow_io import dataframe_to_arrow, is_arrow_native, load_file_to_sqlite, query_to_arrow
+from data_quality_assistant.db.executor import DEFAULT_MMAP_SIZE, get_executor
+from data_quality_assistant.models.executor_metrics import ExecutorMetrics
 
 load_dotenv()
 
@@ -22,8 +26,16 @@ logger = logging.getLogger(__name__)
 class DataQualityAssistant:
     """AI assistant for analyzing data quality using natural language questions."""
     
-    def __init__(self, data_path: str, model_name: str = "gpt-4o-mini") -> None:
+    def __init__(
+        self,
+        data_path: str,
+        model_name: str = "gpt-4o-mini",
+        columns: Optional[List[str]] = None,
+        executor_workers: int = 0,
+        mmap_size: int = DEFAULT_MMAP_SIZE
+    ) -> None:
         self.db_path = "data_quality.db"
+        self.columns = columns
         
         self.llm = ChatOpenAI(
             model=model_name,
@@ -33,33 +45,67 @@ class DataQualityAssistant:
         )
         
         self.db, self.data_info = self._setup_database(data_path)
-        self.nodes = DataQualityNodes(self.llm, self.db, self.data_info)
+        self.executor = (
+            get_executor(self.db_path, max_workers=executor_workers, mmap_size=mmap_size)
+            if executor_workers > 0 else None
+        )
+        self.nodes = DataQualityNodes(self.llm, self.db, self.data_info, self.executor)
         self.workflow = DataQualityWorkflow(self.nodes)
         
         logger.info(f"Assistant initialized with data from: {data_path}")
     
     def _setup_database(self, data_path: str) -> Tuple[SQLDatabase, dict]:
+        conn = sqlite3.connect(self.db_path)
+        try:
+            if is_arrow_native(data_path):
+                data_info = load_file_to_sqlite(data_path, conn, 'data_table', columns=self.columns)
+            else:
+                data_info = self._load_with_pandas(data_path, conn)
+        finally:
+            conn.close()
+        
+        db = SQLDatabase.from_uri(f"sqlite:///{self.db_path}")
+        
+        logger.info(f"Database setup complete. Data shape: {data_info['shape']}")
+        return db, data_info
+    
+    def _load_with_pandas(self, data_path: str, conn: sqlite3.Connection) -> dict:
         if data_path.endswith(('.xlsx', '.xls')):
-            df = pd.read_excel(data_path)
+            df = pd.read_excel(data_path, usecols=self.columns)
         elif data_path.endswith('.csv'):
-            df = pd.read_csv(data_path)
+            df = pd.read_csv(data_path, usecols=self.columns)
         else:
             raise ValueError(f"Unsupported file format: {data_path}")
         
-        conn = sqlite3.connect(self.db_path)
         df.to_sql('data_table', conn, if_exists='replace', index=False)
-        conn.close()
         
-        db = SQLDatabase.from_uri(f"sqlite:///{self.db_path}")
-        
-        data_info = {
+        return {
             'shape': df.shape,
             'columns': df.columns.tolist(),
             'dtypes': df.dtypes.to_dict(),
+            'missing_values': int(df.isnull().sum().sum()),
+            'preview': dataframe_to_arrow(df.head(15)),
         }
+    
+    def query_arrow(self, sql_query: str) -> pa.Table:
+        """Run a SQL query against the dataset and return the result as an Arrow table."""
+        if self.executor:
+            return self.executor.run(sql_query)
         
-        logger.info(f"Database setup complete. Data shape: {df.shape}")
-        return db, data_info
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return query_to_arrow(conn, sql_query)
+        finally:
+            conn.close()
+    
+    def executor_metrics(self) -> Optional[ExecutorMetrics]:
+        """Return queue and worker metrics when queries run on a process pool."""
+        return self.executor.metrics() if self.executor else None
+    
+    def close(self) -> None:
+        """Stop using the shared query worker pool; it is shut down at interpreter exit."""
+        self.executor = None
+        self.nodes.executor = None
     
     def ask_question(self, question: str) -> DataQualityState:
         """Ask a question about data quality and get analysis results."""
@@ -0,0 +1,216 @@
+import json
+import sqlite3
+from typing import Any, Dict, Iterator, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+PARQUET_EXTENSIONS = ('.parquet', '.pq')
+ARROW_IPC_EXTENSIONS = ('.arrow', '.feather', '.ipc')
+DEFAULT_BATCH_SIZE = 65_536
+
+
+def is_arrow_native(data_path: str) -> bool:
+    """Check whether a file can be read without going through pandas parsers."""
+    return data_path.lower().endswith(PARQUET_EXTENSIONS + ARROW_IPC_EXTENSIONS)
+
+
+def iter_file_batches(
+    data_path: str,
+    columns: Optional[List[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[pa.RecordBatch]:
+    """Stream record batches from a Parquet or Arrow IPC file.
+
+    Parquet files are read row group by row group and only the requested
+    columns are decoded. Arrow IPC files are memory-mapped, so batches are
+    zero-copy views over the file.
+    """
+    if data_path.lower().endswith(PARQUET_EXTENSIONS):
+        parquet_file = pq.ParquetFile(data_path)
+        yield from parquet_file.iter_batches(batch_size=batch_size, columns=columns)
+        return
+
+    if not data_path.lower().endswith(ARROW_IPC_EXTENSIONS):
+        raise ValueError(f"Unsupported file format: {data_path}")
+
+    with pa.memory_map(data_path, 'r') as source:
+        try:
+            reader = pa.ipc.open_file(source)
+            batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+        except pa.ArrowInvalid:
+            source.seek(0)
+            batches = iter(pa.ipc.open_stream(source))
+
+        for batch in batches:
+            yield batch.select(columns) if columns else batch
+
+
+def read_file_schema(data_path: str, columns: Optional[List[str]] = None) -> pa.Schema:
+    """Read the schema of a Parquet or Arrow IPC file without loading any data."""
+    if data_path.lower().endswith(PARQUET_EXTENSIONS):
+        schema = pq.read_schema(data_path)
+    else:
+        with pa.memory_map(data_path, 'r') as source:
+            try:
+                schema = pa.ipc.open_file(source).schema
+            except pa.ArrowInvalid:
+                source.seek(0)
+                schema = pa.ipc.open_stream(source).schema
+
+    if columns:
+        schema = pa.schema([schema.field(name) for name in columns])
+    return schema
+
+
+def _sqlite_type(data_type: pa.DataType) -> pa.DataType:
+    """Map Arrow types that sqlite3 cannot bind to ones it can."""
+    if pa.types.is_decimal(data_type):
+        return pa.float64()
+    if pa.types.is_nested(data_type):
+        return pa.string()
+    return data_type
+
+
+def _sqlite_schema(schema: pa.Schema) -> pa.Schema:
+    return pa.schema([field.with_type(_sqlite_type(field.type)) for field in schema])
+
+
+def _to_sqlite_batch(batch: pa.RecordBatch) -> pa.RecordBatch:
+    """Cast decimals to float64 and encode nested values (lists, structs, maps) as JSON."""
+    arrays = []
+    for column in batch.columns:
+        if pa.types.is_decimal(column.type):
+            column = column.cast(pa.float64())
+        elif pa.types.is_nested(column.type):
+            column = pa.array(
+                [None if value is None else json.dumps(value, default=str) for value in column.to_pylist()],
+                type=pa.string()
+            )
+        arrays.append(column)
+    return pa.RecordBatch.from_arrays(arrays, names=batch.schema.names)
+
+
+def load_file_to_sqlite(
+    data_path: str,
+    conn: sqlite3.Connection,
+    table_name: str,
+    columns: Optional[List[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    preview_rows: int = 15
+) -> Dict[str, Any]:
+    """Load a Parquet or Arrow IPC file into SQLite one batch at a time.
+
+    Peak memory is bounded by ``batch_size`` rather than by the file size.
+    Decimal columns are stored as REAL and nested columns as JSON text.
+    Returns the same data summary as the pandas loaders plus a small preview.
+    """
+    schema = read_file_schema(data_path, columns)
+    sqlite_schema = _sqlite_schema(schema)
+    sqlite_schema.empty_table().to_pandas().to_sql(table_name, conn, if_exists='replace', index=False)
+
+    num_rows = 0
+    missing_values = 0
+    preview_batches = []
+    preview_count = 0
+
+    for batch in iter_file_batches(data_path, columns, batch_size):
+        if batch.num_rows == 0:
+            continue
+        _to_sqlite_batch(batch).to_pandas().to_sql(table_name, conn, if_exists='append', index=False)
+
+        num_rows += batch.num_rows
+        missing_values += sum(column.null_count for column in batch.columns)
+        if preview_count < preview_rows:
+            preview_batches.append(batch.slice(0, preview_rows - preview_count))
+            preview_count += preview_batches[-1].num_rows
+
+    conn.commit()
+
+    return {
+        'shape': (num_rows, len(schema)),
+        'columns': schema.names,
+        'dtypes': sqlite_schema.empty_table().to_pandas().dtypes.to_dict(),
+        'missing_values': missing_values,
+        'preview': pa.Table.from_batches(preview_batches, schema=schema),
+    }
+
+
+def dataframe_to_arrow(df: pd.DataFrame) -> pa.Table:
+    """Convert a DataFrame to Arrow, stringifying object columns that mix types."""
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        object_columns = df.select_dtypes(include='object').columns
+        df = df.copy()
+        df[object_columns] = df[object_columns].map(lambda value: None if pd.isna(value) else str(value))
+        return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def _column_array(values: List[Any], as_string: bool = False) -> pa.Array:
+    """Build an Arrow array, falling back to strings for mixed-type SQLite columns."""
+    if not as_string:
+        try:
+            return pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+    return pa.array([None if value is None else str(value) for value in values], type=pa.string())
+
+
+def _cursor_batches(cursor: sqlite3.Cursor, batch_size: int) -> Iterator[pa.RecordBatch]:
+    """Drain a cursor into Arrow record batches of at most ``batch_size`` rows.
+
+    Once a column falls back to strings it stays a string column in every
+    later batch.
+    """
+    names = [description[0] for description in cursor.description or []]
+    string_columns = set()
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        arrays = []
+        for i, values in enumerate(zip(*rows)):
+            array = _column_array(list(values), as_string=i in string_columns)
+            if pa.types.is_string(array.type):
+                string_columns.add(i)
+            arrays.append(array)
+        yield pa.RecordBatch.from_arrays(arrays, names=names)
+
+
+def query_to_arrow(
+    conn: sqlite3.Connection,
+    sql_query: str,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> pa.Table:
+    """Execute a query and return the result as an Arrow table.
+
+    This is not a zero-copy handoff: sqlite3 only returns rows as Python
+    tuples, so each batch is fetched with ``fetchmany``, transposed in
+    Python and converted column by column into Arrow arrays. What it avoids
+    is the extra pandas DataFrame and the string formatting of every value.
+
+    A column that is a string in any batch becomes a string column in the
+    result; other type differences between batches (all-NULL batches,
+    INTEGER next to REAL) are promoted to a common type.
+    """
+    cursor = conn.execute(sql_query)
+    try:
+        names = [description[0] for description in cursor.description or []]
+        tables = [pa.Table.from_batches([batch]) for batch in _cursor_batches(cursor, batch_size)]
+    finally:
+        cursor.close()
+
+    if not tables:
+        return pa.table([pa.array([], type=pa.null()) for _ in names], names=names)
+
+    string_columns = {
+        i for table in tables for i, field in enumerate(table.schema) if pa.types.is_string(field.type)
+    }
+    # Positional names keep duplicate column names (``SELECT x, x``) unifiable.
+    positional = [str(i) for i in range(len(names))]
+    tables = [table.rename_columns(positional) for table in tables]
+    for i in string_columns:
+        tables = [table.set_column(i, positional[i], table.column(i).cast(pa.string())) for table in tables]
+    return pa.concat_tables(tables, promote_options="permissive").rename_columns(names)
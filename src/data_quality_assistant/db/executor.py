@@ -0,0 +1,275 @@
+import atexit
+import multiprocessing
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pyarrow as pa
+
+from data_quality_assistant.db.arrow_io import query_to_arrow
+from data_quality_assistant.models.executor_metrics import ExecutorMetrics, WorkerMetrics
+
+DEFAULT_MMAP_SIZE = 256 * 1024 * 1024
+MAX_STRING_LENGTH = 300
+
+_worker_conn: Optional[sqlite3.Connection] = None
+_executors: Dict[str, "QueryExecutor"] = {}
+_executors_lock = threading.Lock()
+
+
+def _connect_read_only(db_path: str, mmap_size: int) -> sqlite3.Connection:
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    conn.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+    conn.execute("PRAGMA query_only=1")
+    return conn
+
+
+def _init_worker(db_path: str, mmap_size: int) -> None:
+    """Open the read-only, memory-mapped connection a worker keeps for its lifetime."""
+    global _worker_conn
+    _worker_conn = _connect_read_only(db_path, mmap_size)
+
+
+def _truncate(value: Any, length: int = MAX_STRING_LENGTH, suffix: str = "...") -> Any:
+    """Shorten long strings on a word boundary, as ``SQLDatabase.run`` does."""
+    if not isinstance(value, str) or len(value) <= length:
+        return value
+    return value[:length - len(suffix)].rsplit(" ", 1)[0] + suffix
+
+
+def _timed(func: Callable[[str], Any], sql_query: str) -> Tuple[int, float, Any]:
+    """Run ``func`` in a worker, returning any exception instead of raising it.
+
+    Keeping the PID and elapsed time for failures lets the parent attribute
+    the work to the worker that did it.
+    """
+    start = time.perf_counter()
+    try:
+        result = func(sql_query)
+    except Exception as e:
+        result = e
+    return os.getpid(), time.perf_counter() - start, result
+
+
+def _query_ipc(sql_query: str) -> bytes:
+    table = query_to_arrow(_worker_conn, sql_query)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _query_text(sql_query: str) -> str:
+    try:
+        rows = _worker_conn.execute(sql_query).fetchall()
+    except sqlite3.Error as e:
+        return f"Error: {e}"
+    rows = [tuple(_truncate(value) for value in row) for row in rows]
+    return str(rows) if rows else ""
+
+
+def _run_query(sql_query: str) -> Tuple[int, float, Any]:
+    """Execute a query in a worker and serialize the result as an Arrow IPC stream."""
+    return _timed(_query_ipc, sql_query)
+
+
+def _run_query_text(sql_query: str) -> Tuple[int, float, Any]:
+    """Execute a query in a worker and format it like ``QuerySQLDatabaseTool``.
+
+    SQL errors come back as ``"Error: ..."`` text for the LLM and long
+    strings are truncated to ``MAX_STRING_LENGTH`` characters.
+    """
+    return _timed(_query_text, sql_query)
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    """Avoid ``fork`` so workers don't inherit a multithreaded server's state."""
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+
+def get_executor(
+    db_path: str,
+    max_workers: Optional[int] = None,
+    mmap_size: int = DEFAULT_MMAP_SIZE
+) -> "QueryExecutor":
+    """Return the executor shared by every session that queries ``db_path``.
+
+    The first call creates the pool; later calls reuse it and ignore the
+    sizing arguments.
+    """
+    key = os.path.abspath(db_path)
+    with _executors_lock:
+        executor = _executors.get(key)
+        if executor is None or executor.closed:
+            executor = QueryExecutor(db_path, max_workers=max_workers, mmap_size=mmap_size)
+            _executors[key] = executor
+        return executor
+
+
+@atexit.register
+def shutdown_executors() -> None:
+    """Stop every shared executor."""
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown()
+
+
+class QueryExecutor:
+    """Pool of worker processes that run SQLite queries off the caller's thread.
+
+    Each worker holds its own read-only connection with ``mmap_size`` set, so
+    concurrent queries share the OS page cache instead of copying pages into
+    per-connection caches. Results cross the process boundary as Arrow IPC
+    bytes, and the text form used by the LLM is built inside the worker.
+    Use ``get_executor`` to share one pool between sessions.
+    """
+
+    def __init__(self, db_path: str, max_workers: Optional[int] = None, mmap_size: int = DEFAULT_MMAP_SIZE) -> None:
+        if not os.path.isfile(db_path):
+            raise FileNotFoundError(f"Database not found: {db_path}")
+        _connect_read_only(db_path, mmap_size).close()
+
+        self.db_path = db_path
+        self.mmap_size = mmap_size
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._pool = self._new_pool()
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self._pending = 0
+        self._completed = 0
+        self._workers: Dict[int, WorkerMetrics] = {}
+        self.closed = False
+
+    def submit(self, sql_query: str) -> "Future[pa.Table]":
+        """Dispatch a query to the pool and return a future for its Arrow table."""
+        return self._dispatch(_run_query, sql_query, self._decode_table)
+
+    def submit_text(self, sql_query: str) -> "Future[str]":
+        """Dispatch a query to the pool and return a future for its text result."""
+        return self._dispatch(_run_query_text, sql_query, lambda result: result)
+
+    def run(self, sql_query: str) -> pa.Table:
+        """Execute a query on the pool and wait for its Arrow table."""
+        return self.submit(sql_query).result()
+
+    def run_text(self, sql_query: str) -> str:
+        """Execute a query on the pool and wait for its text result."""
+        return self.submit_text(sql_query).result()
+
+    def metrics(self) -> ExecutorMetrics:
+        """Report waiting and running queries and per-worker utilization since startup."""
+        with self._lock:
+            uptime = time.perf_counter() - self._started
+            workers = {
+                pid: WorkerMetrics(
+                    queries=worker.queries,
+                    busy_seconds=worker.busy_seconds,
+                    utilization=worker.busy_seconds / uptime if uptime else 0.0
+                )
+                for pid, worker in self._workers.items()
+            }
+            return ExecutorMetrics(
+                max_workers=self.max_workers,
+                queue_depth=max(0, self._pending - self.max_workers),
+                in_flight=min(self._pending, self.max_workers),
+                completed=self._completed,
+                uptime_seconds=uptime,
+                workers=workers
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes."""
+        self.closed = True
+        self._pool.shutdown(wait=wait, cancel_futures=not wait)
+
+    @staticmethod
+    def _decode_table(payload: bytes) -> pa.Table:
+        return pa.ipc.open_stream(payload).read_all()
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=_pool_context(),
+            initializer=_init_worker,
+            initargs=(self.db_path, self.mmap_size)
+        )
+
+    def _replace_pool(self, broken_pool: ProcessPoolExecutor) -> None:
+        """Swap in a fresh pool after a worker died (e.g. killed by the OOM killer)."""
+        with self._lock:
+            if self.closed or self._pool is not broken_pool:
+                return
+            self._pool = self._new_pool()
+        broken_pool.shutdown(wait=False)
+
+    def _dispatch(self, func, sql_query: str, decode) -> Future:
+        result_future: Future = Future()
+        self._submit(func, sql_query, decode, result_future, retry=True)
+        return result_future
+
+    def _submit(self, func, sql_query: str, decode, result_future: Future, retry: bool) -> None:
+        """Send a query to the current pool, retrying once on a fresh pool if it broke.
+
+        A dead worker fails every query in flight on its pool, not just the one
+        that killed it, so each affected query gets one more attempt.
+        """
+        pool = self._pool
+        try:
+            worker_future = pool.submit(func, sql_query)
+        except BrokenProcessPool:
+            if not retry:
+                raise
+            self._replace_pool(pool)
+            self._submit(func, sql_query, decode, result_future, retry=False)
+            return
+        with self._lock:
+            self._pending += 1
+
+        def _on_done(done: Future) -> None:
+            if done.cancelled():
+                with self._lock:
+                    self._pending -= 1
+                result_future.cancel()
+                return
+
+            error = done.exception()
+            if isinstance(error, BrokenProcessPool):
+                with self._lock:
+                    self._pending -= 1
+                self._replace_pool(pool)
+                if retry:
+                    try:
+                        self._submit(func, sql_query, decode, result_future, retry=False)
+                    except Exception as e:
+                        result_future.set_exception(e)
+                    return
+                result_future.set_exception(error)
+                return
+
+            with self._lock:
+                self._pending -= 1
+                self._completed += 1
+                if error is None:
+                    pid, busy_seconds, result = done.result()
+                    worker = self._workers.setdefault(pid, WorkerMetrics())
+                    worker.queries += 1
+                    worker.busy_seconds += busy_seconds
+
+            if error is None and isinstance(result, Exception):
+                error = result
+            if error is not None:
+                result_future.set_exception(error)
+                return
+            try:
+                result_future.set_result(decode(result))
+            except Exception as e:
+                result_future.set_exception(e)
+
+        worker_future.add_done_callback(_on_done)
@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from langchain_openai import ChatOpenAI
 from langchain_community.utilities import SQLDatabase
 from langchain_community.tools.sql_database.tool import QuerySQLDatabaseTool
@@ -7,6 +7,7 @@ from langchain_community.tools.sql_database.tool import QuerySQLDatabaseTool
 from data_quality_assistant.models.state import DataQualityState, VisualizationData
 from data_quality_assistant.models.llm_response import SqlGenerationResponse, AnalysisResponse
 from data_quality_assistant.llm.prompts import PromptTemplates
+from data_quality_assistant.db.executor import QueryExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -14,10 +15,17 @@ logger = logging.getLogger(__name__)
 class DataQualityNodes:
     """Collection of processing nodes for data quality analysis."""
     
-    def __init__(self, llm: ChatOpenAI, db: SQLDatabase, data_info: Dict[str, Any]) -> None:
+    def __init__(
+        self,
+        llm: ChatOpenAI,
+        db: SQLDatabase,
+        data_info: Dict[str, Any],
+        executor: Optional[QueryExecutor] = None
+    ) -> None:
         self.llm = llm
         self.db = db
         self.data_info = data_info
+        self.executor = executor
         self.prompts = PromptTemplates()
     
     def generate_sql(self, state: DataQualityState) -> DataQualityState:
@@ -64,8 +72,11 @@ class DataQualityNodes:
             return state
         
         try:
-            query_tool = QuerySQLDatabaseTool(db=self.db)
-            result = query_tool.invoke(state.sql_query)
+            if self.executor:
+                result = self.executor.run_text(state.sql_query)
+            else:
+                query_tool = QuerySQLDatabaseTool(db=self.db)
+                result = query_tool.invoke(state.sql_query)
             return DataQualityState(
                 user_question=state.user_question,
                 sql_query=state.sql_query,
@@ -0,0 +1,17 @@
+from typing import Dict
+from pydantic import BaseModel, Field
+
+
+class WorkerMetrics(BaseModel):
+    queries: int = Field(default=0, description="Queries completed by the worker")
+    busy_seconds: float = Field(default=0.0, description="Time spent executing queries")
+    utilization: float = Field(default=0.0, description="Busy time as a fraction of executor uptime")
+
+
+class ExecutorMetrics(BaseModel):
+    max_workers: int = Field(description="Size of the worker pool")
+    queue_depth: int = Field(default=0, description="Queries waiting for a free worker")
+    in_flight: int = Field(default=0, description="Queries currently running on a worker")
+    completed: int = Field(default=0, description="Queries finished since startup")
+    uptime_seconds: float = Field(default=0.0, description="Time since the executor started")
+    workers: Dict[int, WorkerMetrics] = Field(default_factory=dict, description="Metrics keyed by worker PID")
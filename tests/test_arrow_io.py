@@ -0,0 +1,129 @@
+import json
+import sqlite3
+from decimal import Decimal
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from data_quality_assistant.db.arrow_io import dataframe_to_arrow, load_file_to_sqlite, query_to_arrow
+
+
+@pytest.fixture
+def table() -> pa.Table:
+    return pa.table({
+        'id': [1, 2, 3, 4, 5],
+        'name': ['a', None, 'c', 'd', None],
+        'amount': [1.5, 2.5, None, 4.5, 5.5],
+    })
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(':memory:')
+    yield conn
+    conn.close()
+
+
+def test_load_parquet_streams_batches(tmp_path, table, conn):
+    path = str(tmp_path / 'data.parquet')
+    pq.write_table(table, path, row_group_size=2)
+
+    info = load_file_to_sqlite(path, conn, 'data_table', batch_size=2, preview_rows=3)
+
+    assert info['shape'] == (5, 3)
+    assert info['columns'] == ['id', 'name', 'amount']
+    assert info['missing_values'] == 3
+    assert info['preview'].num_rows == 3
+    assert conn.execute('SELECT COUNT(*), SUM(id) FROM data_table').fetchone() == (5, 15)
+
+
+def test_load_selects_columns(tmp_path, table, conn):
+    path = str(tmp_path / 'data.parquet')
+    pq.write_table(table, path)
+
+    info = load_file_to_sqlite(path, conn, 'data_table', columns=['name'])
+
+    assert info['shape'] == (5, 1)
+    assert info['columns'] == ['name']
+    assert info['preview'].column_names == ['name']
+    assert [row[1] for row in conn.execute('PRAGMA table_info(data_table)')] == ['name']
+
+
+@pytest.mark.parametrize('writer', [pa.ipc.new_file, pa.ipc.new_stream])
+def test_load_arrow_ipc_file_and_stream(tmp_path, table, conn, writer):
+    path = str(tmp_path / 'data.arrow')
+    with pa.OSFile(path, 'wb') as sink, writer(sink, table.schema) as ipc_writer:
+        ipc_writer.write_table(table, max_chunksize=2)
+
+    info = load_file_to_sqlite(path, conn, 'data_table', columns=['id', 'amount'])
+
+    assert info['shape'] == (5, 2)
+    assert info['missing_values'] == 1
+    assert conn.execute('SELECT COUNT(*) FROM data_table').fetchone() == (5,)
+
+
+def test_load_casts_decimal_column_to_float(tmp_path, conn):
+    path = str(tmp_path / 'data.parquet')
+    amounts = pa.array([Decimal('1.25'), None, Decimal('3.50')], type=pa.decimal128(10, 2))
+    pq.write_table(pa.table({'amount': amounts}), path)
+
+    info = load_file_to_sqlite(path, conn, 'data_table')
+
+    assert info['dtypes']['amount'] == 'float64'
+    assert conn.execute('SELECT amount FROM data_table').fetchall() == [(1.25,), (None,), (3.5,)]
+
+
+def test_load_encodes_nested_columns_as_json(tmp_path, conn):
+    path = str(tmp_path / 'data.parquet')
+    pq.write_table(pa.table({
+        'tags': [['a', 'b'], None, []],
+        'point': [{'x': 1, 'y': 2}, {'x': 3, 'y': None}, None],
+    }), path)
+
+    load_file_to_sqlite(path, conn, 'data_table')
+
+    rows = conn.execute('SELECT tags, point FROM data_table').fetchall()
+    assert [json.loads(tags) if tags else tags for tags, _ in rows] == [['a', 'b'], None, []]
+    assert [json.loads(point) if point else point for _, point in rows] == [{'x': 1, 'y': 2}, {'x': 3, 'y': None}, None]
+
+
+def test_query_to_arrow_keeps_mixed_type_column_as_string(conn):
+    conn.execute('CREATE TABLE data_table (x)')
+    conn.executemany('INSERT INTO data_table VALUES (?)', [(1,), (2,), (3,), ('a',), (5,)])
+
+    result = query_to_arrow(conn, 'SELECT x FROM data_table', batch_size=2)
+
+    assert result.schema.field('x').type == pa.string()
+    assert result.column('x').to_pylist() == ['1', '2', '3', 'a', '5']
+
+
+def test_query_to_arrow_promotes_null_and_numeric_batches(conn):
+    conn.execute('CREATE TABLE data_table (x)')
+    conn.executemany('INSERT INTO data_table VALUES (?)', [(None,), (None,), (1,), (2.5,)])
+
+    result = query_to_arrow(conn, 'SELECT x FROM data_table', batch_size=2)
+
+    assert result.schema.field('x').type == pa.float64()
+    assert result.column('x').to_pylist() == [None, None, 1.0, 2.5]
+
+
+def test_query_to_arrow_empty_result_keeps_duplicate_columns(conn):
+    conn.execute('CREATE TABLE data_table (x)')
+    conn.execute('INSERT INTO data_table VALUES (1)')
+
+    empty = query_to_arrow(conn, 'SELECT x, x FROM data_table WHERE 0')
+    full = query_to_arrow(conn, 'SELECT x, x FROM data_table')
+
+    assert empty.num_rows == 0
+    assert empty.column_names == full.column_names == ['x', 'x']
+
+
+def test_dataframe_to_arrow_handles_mixed_object_column():
+    df = pd.DataFrame({'x': [1, 'a', None], 'y': [1.0, 2.0, 3.0]})
+
+    result = dataframe_to_arrow(df)
+
+    assert result.column('x').to_pylist() == ['1', 'a', None]
+    assert result.schema.field('y').type == pa.float64()
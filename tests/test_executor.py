@@ -0,0 +1,134 @@
+import os
+import signal
+import sqlite3
+
+import pyarrow as pa
+import pytest
+from langchain_community.utilities import SQLDatabase
+
+from data_quality_assistant.db.executor import QueryExecutor, get_executor
+from data_quality_assistant.llm.nodes import DataQualityNodes
+from data_quality_assistant.models.state import DataQualityState
+
+
+@pytest.fixture(scope="module")
+def db_path(tmp_path_factory) -> str:
+    path = str(tmp_path_factory.mktemp("executor") / "data_quality.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE data_table (id INTEGER, note TEXT)")
+    conn.executemany(
+        "INSERT INTO data_table VALUES (?, ?)",
+        [(1, "short"), (2, None), (3, "word " * 100)]
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture(scope="module")
+def executor(db_path):
+    executor = QueryExecutor(db_path, max_workers=2)
+    yield executor
+    executor.shutdown()
+
+
+def test_run_returns_arrow_table(executor):
+    result = executor.run("SELECT id, note FROM data_table ORDER BY id")
+
+    assert isinstance(result, pa.Table)
+    assert result.column("id").to_pylist() == [1, 2, 3]
+
+
+def test_run_text_matches_sql_tool_formatting(executor, db_path):
+    db = SQLDatabase.from_uri(f"sqlite:///{db_path}")
+    query = "SELECT id, note FROM data_table ORDER BY id"
+
+    assert executor.run_text(query) == db.run(query)
+    assert executor.run_text("SELECT id FROM data_table WHERE 0") == ""
+    assert executor.run_text("SELECT missing FROM data_table").startswith("Error: ")
+
+
+def test_run_raises_sql_errors_and_records_worker_metrics(db_path):
+    executor = QueryExecutor(db_path, max_workers=1)
+    try:
+        with pytest.raises(sqlite3.OperationalError):
+            executor.run("SELECT missing FROM data_table")
+        with pytest.raises(sqlite3.OperationalError):
+            executor.run("DELETE FROM data_table")
+
+        metrics = executor.metrics()
+        assert metrics.queue_depth == 0
+        assert metrics.completed == 2
+        assert sum(worker.queries for worker in metrics.workers.values()) == 2
+    finally:
+        executor.shutdown()
+
+
+def test_rejected_submit_does_not_leak_queue_depth(db_path):
+    executor = QueryExecutor(db_path, max_workers=1)
+    executor.shutdown()
+
+    with pytest.raises(RuntimeError):
+        executor.submit("SELECT 1")
+
+    assert executor.metrics().queue_depth == 0
+
+
+def test_missing_database_fails_early(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        QueryExecutor(str(tmp_path / "missing.db"))
+
+
+def test_get_executor_shares_pool_per_database(db_path):
+    first = get_executor(db_path, max_workers=1)
+    try:
+        assert get_executor(db_path, max_workers=4) is first
+        first.shutdown()
+        assert get_executor(db_path, max_workers=1) is not first
+    finally:
+        get_executor(db_path).shutdown()
+
+
+def test_execute_query_uses_executor(executor, db_path):
+    db = SQLDatabase.from_uri(f"sqlite:///{db_path}")
+    inline = DataQualityNodes(None, db, {})
+    pooled = DataQualityNodes(None, db, {}, executor)
+
+    state = DataQualityState(user_question="count", sql_query="SELECT COUNT(*) FROM data_table")
+    assert pooled.execute_query(state).query_result == inline.execute_query(state).query_result == "[(3,)]"
+
+    bad_state = DataQualityState(user_question="bad", sql_query="SELECT missing FROM data_table")
+    result = pooled.execute_query(bad_state)
+    assert result.error_message is None
+    assert result.query_result.startswith("Error: ")
+
+
+def test_metrics_split_running_and_waiting_queries(db_path):
+    executor = QueryExecutor(db_path, max_workers=1)
+    slow_query = "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 3000000) SELECT COUNT(*) FROM n"
+    try:
+        futures = [executor.submit_text(slow_query) for _ in range(3)]
+        metrics = executor.metrics()
+        assert metrics.in_flight == 1
+        assert metrics.queue_depth == 2
+        for future in futures:
+            future.result()
+
+        metrics = executor.metrics()
+        assert (metrics.in_flight, metrics.queue_depth) == (0, 0)
+    finally:
+        executor.shutdown()
+
+
+def test_killed_worker_does_not_break_shared_pool(db_path):
+    executor = get_executor(db_path, max_workers=1)
+    try:
+        executor.run_text("SELECT 1")
+        for pid in executor.metrics().workers:
+            os.kill(pid, signal.SIGKILL)
+
+        assert get_executor(db_path) is executor
+        assert executor.run_text("SELECT COUNT(*) FROM data_table") == "[(3,)]"
+        assert get_executor(db_path).run("SELECT id FROM data_table").num_rows == 3
+    finally:
+        executor.shutdown()